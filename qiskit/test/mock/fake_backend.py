@@ -38,6 +38,21 @@ class _Credentials:
         self.project = "project"
 
 
+def _get_noise_model(backend, properties):
+    """Return the Aer noise model of a fake backend.
+
+    Building the noise model walks every gate and qubit of the backend properties, so the last
+    one built is cached on ``backend`` and only rebuilt when ``properties`` is a different object
+    than the one it was built from.
+    """
+    from qiskit.providers.aer.noise import NoiseModel
+
+    if backend._noise_model is None or backend._noise_model_properties is not properties:
+        backend._noise_model = NoiseModel.from_backend(backend, warnings=False)
+        backend._noise_model_properties = properties
+    return backend._noise_model
+
+
 class FakeBackend(BackendV1):
     """This is a dummy backend just for testing purposes."""
 
@@ -51,6 +66,8 @@ class FakeBackend(BackendV1):
         super().__init__(configuration)
         self.time_alive = time_alive
         self._credentials = _Credentials()
+        self._noise_model = None
+        self._noise_model_properties = None
 
     def properties(self):
         """Return backend properties"""
@@ -141,13 +158,17 @@ class FakeBackend(BackendV1):
                 job = sim.run(circuits, system_model=system_model, **kwargs)
             else:
                 sim = aer.Aer.get_backend("qasm_simulator")
-                if self.properties():
-                    from qiskit.providers.aer.noise import NoiseModel
-
-                    noise_model = NoiseModel.from_backend(self, warnings=False)
-                    job = sim.run(circuits, noise_model=noise_model, **kwargs)
-                else:
+                if "noise_model" in kwargs:
+                    # An explicit noise model (or None) replaces the one derived from the
+                    # backend properties, so there is no point in building the latter.
                     job = sim.run(circuits, **kwargs)
+                else:
+                    properties = self.properties()
+                    if properties:
+                        noise_model = _get_noise_model(self, properties)
+                        job = sim.run(circuits, noise_model=noise_model, **kwargs)
+                    else:
+                        job = sim.run(circuits, **kwargs)
         else:
             if pulse_job:
                 raise QiskitError("Unable to run pulse schedules without qiskit-aer installed")
@@ -169,6 +190,8 @@ class FakeLegacyBackend(BaseBackend):
         super().__init__(configuration)
         self.time_alive = time_alive
         self._credentials = _Credentials()
+        self._noise_model = None
+        self._noise_model_properties = None
 
     def properties(self):
         """Return backend properties"""
@@ -233,10 +256,9 @@ class FakeLegacyBackend(BaseBackend):
                 job = sim.run(qobj, system_model)
             else:
                 sim = aer.Aer.get_backend("qasm_simulator")
-                if self.properties():
-                    from qiskit.providers.aer.noise import NoiseModel
-
-                    noise_model = NoiseModel.from_backend(self, warnings=False)
+                properties = self.properties()
+                if properties:
+                    noise_model = _get_noise_model(self, properties)
                     job = sim.run(qobj, noise_model=noise_model)
                 else:
                     job = sim.run(qobj)
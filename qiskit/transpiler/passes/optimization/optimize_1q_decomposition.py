@@ -12,7 +12,6 @@
 
 """Optimize chains of single-qubit gates using Euler 1q decomposer"""
 
-import copy
 import logging
 
 import numpy as np
@@ -24,6 +23,22 @@ from qiskit.converters import circuit_to_dag
 
 logger = logging.getLogger(__name__)
 
+# (name, gates, gate set) for each Euler basis, so the subset checks done when selecting
+# decomposers don't need to rebuild sets from the gate lists on every instantiation.
+_EULER_BASIS_GATE_SETS = tuple(
+    (name, tuple(gates), frozenset(gates))
+    for name, gates in one_qubit_decompose.ONE_QUBIT_EULER_BASIS_GATES.items()
+)
+
+
+def _is_near_identity(matrix, atol=1e-6):
+    """Check whether the 2x2 unitary ``matrix`` is within ``atol`` of the identity up to phase.
+
+    The tolerance is deliberately far looser than the decomposers' own, so a ``False`` return
+    guarantees that synthesis could not reduce the matrix to an empty sequence.
+    """
+    return abs(matrix[0, 1]) <= atol and abs(matrix[0, 0] - matrix[1, 1]) <= atol
+
 
 class Optimize1qGatesDecomposition(TransformationPass):
     """Optimize chains of single-qubit gates by combining them into a single gate."""
@@ -43,30 +58,31 @@ class Optimize1qGatesDecomposition(TransformationPass):
 
         if basis:
             self._decomposers = {}
+            decomposer_gate_sets = {}
             basis_set = set(basis)
-            euler_basis_gates = one_qubit_decompose.ONE_QUBIT_EULER_BASIS_GATES
-            for euler_basis_name, gates in euler_basis_gates.items():
-                if set(gates).issubset(basis_set):
-                    basis_copy = copy.copy(self._decomposers)
-                    for base in basis_copy.keys():
-                        # check if gates are a superset of another basis
-                        if set(base).issubset(set(gates)):
-                            # if so, remove that basis
-                            del self._decomposers[base]
-                        # check if the gates are a subset of another basis
-                        elif set(gates).issubset(set(base)):
-                            # if so, don't bother
-                            break
-                    # if not a subset, add it to the list
-                    else:
-                        self._decomposers[
-                            tuple(gates)
-                        ] = one_qubit_decompose.OneQubitEulerDecomposer(euler_basis_name)
-
-    def _resynthesize_run(self, run):
+            for euler_basis_name, gates, gate_set in _EULER_BASIS_GATE_SETS:
+                if not gate_set.issubset(basis_set):
+                    continue
+                # if the gates are a strict subset of an already selected basis, don't bother
+                if any(gate_set < other for other in decomposer_gate_sets.values()):
+                    continue
+                # otherwise drop every selected basis that these gates are a superset of
+                for base, other in list(decomposer_gate_sets.items()):
+                    if other.issubset(gate_set):
+                        del self._decomposers[base]
+                        del decomposer_gate_sets[base]
+                self._decomposers[gates] = one_qubit_decompose.OneQubitEulerDecomposer(
+                    euler_basis_name
+                )
+                decomposer_gate_sets[gates] = gate_set
+
+    def _resynthesize_run(self, run, synth_cache=None):
         """
         Resynthesizes one `run`, typically extracted via `dag.collect_1q_runs`.
 
+        If ``synth_cache`` is given, it is used to memoize the synthesis result by the exact bytes
+        of the run's unitary, so that runs collapsing to the same matrix are only decomposed once.
+
         Returns (basis, circuit) containing the newly synthesized circuit in the indicated basis, or
         (None, None) if no synthesis routine applied.
         """
@@ -75,6 +91,19 @@ class Optimize1qGatesDecomposition(TransformationPass):
         for gate in run[1:]:
             operator = gate.op.to_matrix().dot(operator)
 
+        if synth_cache is not None:
+            key = operator.tobytes()
+            cached = synth_cache.get(key)
+            if cached is None:
+                cached = synth_cache[key] = self._synthesize_operator(operator)
+            return cached
+        return self._synthesize_operator(operator)
+
+    def _synthesize_operator(self, operator):
+        """
+        Decomposes the 2x2 unitary ``operator`` with every available decomposer and returns the
+        shortest (basis, circuit) pair, or (None, None) if there are no decomposers.
+        """
         new_circs = {k: v._decompose(operator) for k, v in self._decomposers.items()}
 
         new_basis, new_circ = None, None
@@ -93,17 +122,22 @@ class Optimize1qGatesDecomposition(TransformationPass):
 
         # do we even have calibrations?
         has_cals_p = dag.calibrations is not None and len(dag.calibrations) > 0
+        # look up the calibration status of each gate once, rather than once per check below
+        if has_cals_p:
+            uncalibrated = [not dag.has_calibration_for(g) for g in old_run]
+        else:
+            uncalibrated = [True] * len(old_run)
         # is this run in the target set of this particular decomposer and also uncalibrated?
         rewriteable_and_in_basis_p = all(
-            g.name in new_basis and (not has_cals_p or not dag.has_calibration_for(g))
-            for g in old_run
+            g.name in new_basis and g_uncalibrated
+            for g, g_uncalibrated in zip(old_run, uncalibrated)
         )
         # does this run have uncalibrated gates?
-        uncalibrated_p = not has_cals_p or any(not dag.has_calibration_for(g) for g in old_run)
+        uncalibrated_p = any(uncalibrated)
         # does this run have gates not in the image of ._decomposers _and_ uncalibrated?
         uncalibrated_and_not_basis_p = any(
-            g.name not in self._target_basis and (not has_cals_p or not dag.has_calibration_for(g))
-            for g in old_run
+            g.name not in self._target_basis and g_uncalibrated
+            for g, g_uncalibrated in zip(old_run, uncalibrated)
         )
 
         if rewriteable_and_in_basis_p and len(old_run) < len(new_circ):
@@ -152,26 +186,59 @@ class Optimize1qGatesDecomposition(TransformationPass):
             logger.info("Skipping pass because no basis is set")
             return dag
 
-        runs = dag.collect_1q_runs()
-        for run in runs:
+        # Synthesis results only depend on the run's unitary, so runs which collapse to the same
+        # matrix can share the decomposition for the duration of this call.
+        synth_cache = {}
+        # The basis is fixed for the whole pass, so resolve the membership tests driving the
+        # U3 special case once rather than scanning the basis list for every run.
+        u3_in_basis = "u3" in self._target_basis
+        lower_u_in_basis = "u2" in self._target_basis or "u1" in self._target_basis
+        basis_set = set(self._target_basis)
+        has_cals_p = dag.calibrations is not None and len(dag.calibrations) > 0
+        resynthesize_run = self._resynthesize_run
+        substitution_checks = self._substitution_checks
+        remove_op_node = dag.remove_op_node
+        for run in dag.collect_1q_runs():
             # SPECIAL CASE: Don't bother to optimize single U3 gates which are in the basis set.
             #     The U3 decomposer is only going to emit a sequence of length 1 anyhow.
-            if "u3" in self._target_basis and len(run) == 1 and isinstance(run[0].op, U3Gate):
+            if u3_in_basis and len(run) == 1 and isinstance(run[0].op, U3Gate):
                 # Toss U3 gates equivalent to the identity; there we get off easy.
                 if np.allclose(run[0].op.to_matrix(), np.eye(2), 1e-15, 0):
-                    dag.remove_op_node(run[0])
+                    remove_op_node(run[0])
                     continue
                 # We might rewrite into lower `u`s if they're available.
-                if "u2" not in self._target_basis and "u1" not in self._target_basis:
+                if not lower_u_in_basis:
                     continue
 
-            new_basis, new_circ = self._resynthesize_run(run)
-
-            if new_circ is not None and self._substitution_checks(dag, run, new_circ, new_basis):
-                new_dag = circuit_to_dag(new_circ)
-                dag.substitute_node_with_dag(run[0], new_dag)
+            # A lone gate which is already in the basis can only be replaced by an empty sequence,
+            # which needs it to be uncalibrated and equivalent to the identity.  Skip synthesis when
+            # that is clearly not the case.  (U3 gates are special-cased in the substitution checks.)
+            if (
+                len(run) == 1
+                and run[0].name in basis_set
+                and not isinstance(run[0].op, U3Gate)
+                and (
+                    (has_cals_p and dag.has_calibration_for(run[0]))
+                    or not _is_near_identity(run[0].op.to_matrix())
+                )
+            ):
+                continue
+
+            new_basis, new_circ = resynthesize_run(run, synth_cache)
+
+            if new_circ is not None and substitution_checks(dag, run, new_circ, new_basis):
+                # Synthesis mostly yields zero or one gates, which can be swapped in directly
+                # without building an intermediate DAG to splice in.
+                if len(new_circ) > 1:
+                    dag.substitute_node_with_dag(run[0], circuit_to_dag(new_circ))
+                else:
+                    if new_circ.data:
+                        dag.substitute_node(run[0], new_circ.data[0][0].copy(), inplace=True)
+                    else:
+                        remove_op_node(run[0])
+                    dag.global_phase += new_circ.global_phase
                 # Delete the other nodes in the run
                 for current_node in run[1:]:
-                    dag.remove_op_node(current_node)
+                    remove_op_node(current_node)
 
         return dag
@@ -48,9 +48,7 @@ class RemoveFinalMeasurements(TransformationPass):
                 # how many times we still need to encounter each barrier
                 # via a child node.
                 if node not in barrier_encounters_remaining:
-                    barrier_encounters_remaining[node] = sum(
-                        1 for _ in dag.quantum_successors(node)
-                    )
+                    barrier_encounters_remaining[node] = len(list(dag.quantum_successors(node)))
                 if barrier_encounters_remaining[node] - 1 > 0:
                     # We've encountered the barrier, but not (yet) via all children.
                     # Record the encounter, and bail!
@@ -84,6 +82,10 @@ class RemoveFinalMeasurements(TransformationPass):
                 clbits_with_final_measures.add(carg)
             dag.remove_op_node(node)
 
+        if not clbits_with_final_measures:
+            # only barriers were removed, so no clbits can have become idle
+            return dag
+
         # ignore any non-idle clbits now that all final op nodes are removed
         idle_wires = set(dag.idle_wires())
         clbits_with_final_measures &= idle_wires
@@ -16,6 +16,15 @@ Validation module
 
 from typing import Set
 
+import numpy as np
+
+
+def _validate_not_nan(name: str, value: object) -> None:
+    # NaN is the only value which compares unequal to itself.  Unlike math.isnan this also works
+    # for numeric types which can't be converted to float.
+    if value != value:  # pylint: disable=comparison-with-itself
+        raise ValueError(f"{name} must be finite, was NaN")
+
 
 def validate_in_set(name: str, value: object, values: Set[object]) -> None:
     """
@@ -37,8 +46,9 @@ def validate_min(name: str, value: float, minimum: float) -> None:
         value: value to check.
         minimum: minimum value allowed.
     Raises:
-        ValueError: invalid value
+        ValueError: invalid value, or NaN
     """
+    _validate_not_nan(name, value)
     if value < minimum:
         raise ValueError(f"{name} must have value >= {minimum}, was {value}")
 
@@ -50,8 +60,9 @@ def validate_min_exclusive(name: str, value: float, minimum: float) -> None:
         value: value to check.
         minimum: minimum value allowed.
     Raises:
-        ValueError: invalid value
+        ValueError: invalid value, or NaN
     """
+    _validate_not_nan(name, value)
     if value <= minimum:
         raise ValueError(f"{name} must have value > {minimum}, was {value}")
 
@@ -63,8 +74,9 @@ def validate_max(name: str, value: float, maximum: float) -> None:
         value: value to check.
         maximum: maximum value allowed.
     Raises:
-        ValueError: invalid value
+        ValueError: invalid value, or NaN
     """
+    _validate_not_nan(name, value)
     if value > maximum:
         raise ValueError(f"{name} must have value <= {maximum}, was {value}")
 
@@ -76,8 +88,9 @@ def validate_max_exclusive(name: str, value: float, maximum: float) -> None:
         value: value to check.
         maximum: maximum value allowed.
     Raises:
-        ValueError: invalid value
+        ValueError: invalid value, or NaN
     """
+    _validate_not_nan(name, value)
     if value >= maximum:
         raise ValueError(f"{name} must have value < {maximum}, was {value}")
 
@@ -90,12 +103,38 @@ def validate_range(name: str, value: float, minimum: float, maximum: float) -> N
         minimum: minimum value allowed.
         maximum: maximum value allowed.
     Raises:
-        ValueError: invalid value
+        ValueError: invalid value, or NaN
     """
+    _validate_not_nan(name, value)
     if value < minimum or value > maximum:
         raise ValueError(f"{name} must have value >= {minimum} and <= {maximum}, was {value}")
 
 
+def validate_range_array(name: str, values: np.ndarray, minimum: float, maximum: float) -> None:
+    """
+    Vectorized version of :func:`validate_range`, checking all the entries of ``values`` at once.
+
+    Args:
+        name: values name.
+        values: array of values to check.
+        minimum: minimum value allowed.
+        maximum: maximum value allowed.
+    Raises:
+        ValueError: invalid value or NaN, reported with the index of the first offending entry in the
+            flattened array.
+    """
+    values = np.asarray(values)
+    invalid = np.less(values, minimum)
+    np.logical_or(invalid, np.greater(values, maximum), out=invalid)
+    np.logical_or(invalid, np.isnan(values), out=invalid)
+    if invalid.any():
+        index = int(np.argmax(invalid))
+        raise ValueError(
+            f"{name} must have values >= {minimum} and <= {maximum}, "
+            f"was {values.flat[index]} at index {index}"
+        )
+
+
 def validate_range_exclusive(name: str, value: float, minimum: float, maximum: float) -> None:
     """
     Args:
@@ -104,8 +143,9 @@ def validate_range_exclusive(name: str, value: float, minimum: float, maximum: f
         minimum: minimum value allowed.
         maximum: maximum value allowed.
     Raises:
-        ValueError: invalid value
+        ValueError: invalid value, or NaN
     """
+    _validate_not_nan(name, value)
     if value <= minimum or value >= maximum:
         raise ValueError(f"{name} must have value > {minimum} and < {maximum}, was {value}")
 
@@ -118,8 +158,9 @@ def validate_range_exclusive_min(name: str, value: float, minimum: float, maximu
         minimum: minimum value allowed.
         maximum: maximum value allowed.
     Raises:
-        ValueError: invalid value
+        ValueError: invalid value, or NaN
     """
+    _validate_not_nan(name, value)
     if value <= minimum or value > maximum:
         raise ValueError(f"{name} must have value > {minimum} and <= {maximum}, was {value}")
 
@@ -132,7 +173,8 @@ def validate_range_exclusive_max(name: str, value: float, minimum: float, maximu
         minimum: minimum value allowed.
         maximum: maximum value allowed.
     Raises:
-        ValueError: invalid value
+        ValueError: invalid value, or NaN
     """
+    _validate_not_nan(name, value)
     if value < minimum or value >= maximum:
         raise ValueError(f"{name} must have value >= {minimum} and < {maximum}, was {value}")
@@ -14,6 +14,8 @@
 
 import unittest
 
+import numpy as np
+
 from test.python.algorithms import QiskitAlgorithmsTestCase
 from qiskit.utils.validation import (
     validate_in_set,
@@ -22,6 +24,7 @@ from qiskit.utils.validation import (
     validate_max,
     validate_max_exclusive,
     validate_range,
+    validate_range_array,
     validate_range_exclusive,
     validate_range_exclusive_min,
     validate_range_exclusive_max,
@@ -85,6 +88,39 @@ class TestValidation(QiskitAlgorithmsTestCase):
             validate_range_exclusive_max("test_value", test_value, 0, 2.5)
         validate_range_exclusive_max("test_value", test_value, 2.5, 3)
 
+    def test_validate_range_array(self):
+        """validate range array test"""
+        test_values = np.array([0.5, 2.5, 1.0])
+        validate_range_array("test_values", test_values, 0.5, 2.5)
+        validate_range_array("test_values", test_values.tolist(), 0, 3)
+        with self.assertRaisesRegex(ValueError, "was 2.5 at index 1"):
+            validate_range_array("test_values", test_values, 0, 2)
+        with self.assertRaisesRegex(ValueError, "was 0.5 at index 0"):
+            validate_range_array("test_values", test_values, 1, 3)
+        with self.assertRaisesRegex(ValueError, "was nan at index 2"):
+            validate_range_array("test_values", np.array([0.5, 1.0, np.nan]), 0, 3)
+
+    def test_validate_nan(self):
+        """validate NaN is rejected by numeric validators"""
+        nan = float("nan")
+        for validator in (validate_min, validate_min_exclusive):
+            with self.subTest(validator=validator.__name__):
+                with self.assertRaisesRegex(ValueError, "test_value must be finite, was NaN"):
+                    validator("test_value", nan, 0)
+        for validator in (validate_max, validate_max_exclusive):
+            with self.subTest(validator=validator.__name__):
+                with self.assertRaisesRegex(ValueError, "test_value must be finite, was NaN"):
+                    validator("test_value", nan, 1)
+        for validator in (
+            validate_range,
+            validate_range_exclusive,
+            validate_range_exclusive_min,
+            validate_range_exclusive_max,
+        ):
+            with self.subTest(validator=validator.__name__):
+                with self.assertRaisesRegex(ValueError, "test_value must be finite, was NaN"):
+                    validator("test_value", nan, 0, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
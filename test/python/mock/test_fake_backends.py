@@ -13,13 +13,14 @@
 """Test of generated fake backends."""
 import math
 import unittest
+from unittest.mock import patch
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit, schedule, transpile, assemble
 from qiskit.pulse import Schedule
 from qiskit.qobj import PulseQobj
 from qiskit.test import QiskitTestCase
 from qiskit.test.mock.utils import ConfigurableFakeBackend
-from qiskit.test.mock import FakeAthens
+from qiskit.test.mock import FakeAthens, FakeLegacyAthens
 from qiskit.utils import optionals
 
 
@@ -82,3 +83,65 @@ class FakeBackendsTest(QiskitTestCase):
         raw_counts = backend.run(trans_qc, shots=1000).result().get_counts()
 
         self.assertEqual(sum(raw_counts.values()), 1000)
+
+    @unittest.skipUnless(optionals.HAS_AER, "qiskit-aer is required to run this test")
+    def test_fake_backends_explicit_noise_model(self):
+        """Fake backends pass an explicit noise model to Aer instead of their own."""
+        from qiskit.providers.aer.noise import NoiseModel
+
+        backend = FakeAthens()
+
+        qc = QuantumCircuit(2)
+        qc.x(range(0, 2))
+        qc.measure_all()
+
+        trans_qc = transpile(qc, backend)
+        for noise_model in [None, NoiseModel()]:
+            with self.subTest(noise_model=noise_model):
+                with patch.object(NoiseModel, "from_backend") as from_backend:
+                    raw_counts = (
+                        backend.run(trans_qc, shots=1000, noise_model=noise_model)
+                        .result()
+                        .get_counts()
+                    )
+                from_backend.assert_not_called()
+                self.assertEqual(raw_counts, {"11": 1000})
+
+    @unittest.skipUnless(optionals.HAS_AER, "qiskit-aer is required to run this test")
+    def test_fake_backends_reuse_noise_model(self):
+        """Repeated runs on a snapshot backend build the noise model once."""
+        from qiskit.providers.aer.noise import NoiseModel
+
+        backend = FakeAthens()
+
+        qc = QuantumCircuit(2)
+        qc.x(range(0, 2))
+        qc.measure_all()
+
+        trans_qc = transpile(qc, backend)
+        with patch.object(
+            NoiseModel, "from_backend", wraps=NoiseModel.from_backend
+        ) as from_backend:
+            backend.run(trans_qc, shots=100).result()
+            backend.run(trans_qc, shots=100).result()
+
+        from_backend.assert_called_once()
+
+    @unittest.skipUnless(optionals.HAS_AER, "qiskit-aer is required to run this test")
+    def test_fake_legacy_backend_reuses_noise_model(self):
+        """Repeated runs on a legacy snapshot backend build the noise model once."""
+        from qiskit.providers.aer.noise import NoiseModel
+
+        qc = QuantumCircuit(2)
+        qc.x(range(0, 2))
+        qc.measure_all()
+
+        with patch.object(
+            NoiseModel, "from_backend", wraps=NoiseModel.from_backend
+        ) as from_backend, self.assertWarns(DeprecationWarning):
+            backend = FakeLegacyAthens()
+            qobj = assemble(transpile(qc, backend), backend, shots=100)
+            backend.run(qobj).result()
+            backend.run(qobj).result()
+
+        from_backend.assert_called_once()
@@ -13,6 +13,7 @@
 """Test the optimize-1q-gate pass"""
 
 import unittest
+import unittest.mock
 
 import ddt
 import numpy as np
@@ -542,6 +543,40 @@ class TestOptimize1qGatesDecomposition(QiskitTestCase):
         msg = f"expected:\n{expected}\nresult:\n{result}"
         self.assertEqual(expected, result, msg=msg)
 
+    def test_repeated_runs_share_synthesis(self):
+        """Test that runs with the same unitary are only decomposed once per pass execution."""
+        qc = QuantumCircuit(3)
+        for qubit in range(3):
+            qc.h(qubit)
+            qc.t(qubit)
+            qc.h(qubit)
+        basis = ["rz", "sx", "cx"]
+        optimize_pass = Optimize1qGatesDecomposition(basis)
+        with unittest.mock.patch.object(
+            optimize_pass, "_synthesize_operator", wraps=optimize_pass._synthesize_operator
+        ) as mock_synth:
+            result = optimize_pass(qc)
+        self.assertEqual(mock_synth.call_count, 1)
+        self.assertEqual(Operator(qc), Operator(result))
+        self.assertEqual(result.count_ops().keys(), {"rz", "sx"})
+
+    def test_single_gate_in_basis_skips_synthesis(self):
+        """Test that lone in-basis gates are left alone without being resynthesized,
+        unless they are equivalent to the identity."""
+        qc = QuantumCircuit(2)
+        qc.sx(0)
+        qc.rz(0.0, 1)
+        basis = ["rz", "sx", "cx"]
+        optimize_pass = Optimize1qGatesDecomposition(basis)
+        with unittest.mock.patch.object(
+            optimize_pass, "_synthesize_operator", wraps=optimize_pass._synthesize_operator
+        ) as mock_synth:
+            result = optimize_pass(qc)
+        self.assertEqual(mock_synth.call_count, 1)
+        expected = QuantumCircuit(2)
+        expected.sx(0)
+        self.assertEqual(expected, result)
+
 
 if __name__ == "__main__":
     unittest.main()